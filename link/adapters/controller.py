@@ -24,11 +24,11 @@ class DJController:
 
     def pull(self, primary_keys: Iterable[PrimaryKey]) -> None:
         """Execute the pull use-case."""
-        self._message_bus.handle(commands.PullEntities(frozenset(self._translator.to_identifiers(primary_keys))))
+        self._message_bus.handle(commands.PullEntities(self._translator.to_identifiers(primary_keys)))
 
     def delete(self, primary_keys: Iterable[PrimaryKey]) -> None:
         """Execute the delete use-case."""
-        self._message_bus.handle(commands.DeleteEntities(frozenset(self._translator.to_identifiers(primary_keys))))
+        self._message_bus.handle(commands.DeleteEntities(self._translator.to_identifiers(primary_keys)))
 
     def list_unshared_entities(self) -> None:
         """Execute the use-case that lists unshared entities."""
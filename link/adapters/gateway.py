@@ -1,7 +1,6 @@
 """Contains the DataJoint gateway class and related classes/functions."""
 from __future__ import annotations
 
-from collections import defaultdict
 from itertools import groupby
 from typing import Iterable
 
@@ -27,7 +26,7 @@ class DJLinkGateway(LinkGateway):
     def create_link(self) -> Link:
         """Create a link instance from persistent data."""
 
-        def translate_assignments(dj_assignments: DJAssignments) -> dict[Components, set[Identifier]]:
+        def translate_assignments(dj_assignments: DJAssignments) -> dict[Components, frozenset[Identifier]]:
             return {
                 Components.SOURCE: self.translator.to_identifiers(dj_assignments.source),
                 Components.OUTBOUND: self.translator.to_identifiers(dj_assignments.outbound),
@@ -36,9 +35,12 @@ class DJLinkGateway(LinkGateway):
 
         def translate_processes(dj_processes: Iterable[DJProcess]) -> dict[Processes, set[Identifier]]:
             persisted_to_domain_process_map = {"PULL": Processes.PULL, "DELETE": Processes.DELETE}
-            domain_processes: dict[Processes, set[Identifier]] = defaultdict(set)
-            active_processes = [process for process in dj_processes if process.current_process != "NONE"]
-            for persisted_process in active_processes:
+            domain_processes: dict[Processes, set[Identifier]] = {
+                process: set() for process in persisted_to_domain_process_map.values()
+            }
+            for persisted_process in dj_processes:
+                if persisted_process.current_process == "NONE":
+                    continue
                 domain_process = persisted_to_domain_process_map[persisted_process.current_process]
                 domain_processes[domain_process].add(self.translator.to_identifier(persisted_process.primary_key))
             return domain_processes
@@ -53,26 +55,19 @@ class DJLinkGateway(LinkGateway):
         )
 
     def apply(self, updates: Iterable[events.StateChanged]) -> None:
-        """Apply updates to the persistent data representing the link."""
-
-        def keyfunc(update: events.StateChanged) -> int:
-            assert update.command is not None
-            return update.command.value
+        """Apply updates to the persistent data representing the link.
 
-        transition_updates = (update for update in updates if update.command)
-        for command_value, command_updates in groupby(sorted(transition_updates, key=keyfunc), key=keyfunc):
+        Consecutive updates sharing the same command are applied together while the order of the updates is kept.
+        """
+        command_methods = {
+            Commands.ADD_TO_LOCAL: self.facade.add_to_local,
+            Commands.REMOVE_FROM_LOCAL: self.facade.remove_from_local,
+            Commands.START_PULL_PROCESS: self.facade.start_pull_process,
+            Commands.FINISH_PULL_PROCESS: self.facade.finish_pull_process,
+            Commands.DEPRECATE: self.facade.deprecate,
+            Commands.START_DELETE_PROCESS: self.facade.start_delete_process,
+            Commands.FINISH_DELETE_PROCESS: self.facade.finish_delete_process,
+        }
+        for command, command_updates in groupby(updates, key=lambda update: update.command):
             primary_keys = (self.translator.to_primary_key(update.identifier) for update in command_updates)
-            if Commands(command_value) is Commands.ADD_TO_LOCAL:
-                self.facade.add_to_local(primary_keys)
-            if Commands(command_value) is Commands.REMOVE_FROM_LOCAL:
-                self.facade.remove_from_local(primary_keys)
-            if Commands(command_value) is Commands.START_PULL_PROCESS:
-                self.facade.start_pull_process(primary_keys)
-            if Commands(command_value) is Commands.FINISH_PULL_PROCESS:
-                self.facade.finish_pull_process(primary_keys)
-            if Commands(command_value) is Commands.DEPRECATE:
-                self.facade.deprecate(primary_keys)
-            if Commands(command_value) is Commands.START_DELETE_PROCESS:
-                self.facade.start_delete_process(primary_keys)
-            if Commands(command_value) is Commands.FINISH_DELETE_PROCESS:
-                self.facade.finish_delete_process(primary_keys)
+            command_methods[command](primary_keys)
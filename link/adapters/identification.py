@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from typing import Union
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 from link.domain.custom_types import Identifier
 
@@ -15,18 +15,24 @@ class IdentificationTranslator:
 
     def __init__(self) -> None:
         """Initialize the translator."""
-        self.__mapping: dict[tuple[tuple[str, Union[str, int, float]], ...], UUID] = {}
+        self.__mapping: dict[tuple[tuple[str, Union[str, int, float]], ...], Identifier] = {}
+        self.__inverse_mapping: dict[Identifier, tuple[tuple[str, Union[str, int, float]], ...]] = {}
 
     def to_identifier(self, primary_key: PrimaryKey) -> Identifier:
         """Translate the given primary key to its corresponding identifier."""
-        primary_key_tuple = tuple((k, v) for k, v in primary_key.items())
-        return Identifier(self.__mapping.setdefault(primary_key_tuple, uuid4()))
-
-    def to_identifiers(self, primary_keys: Iterable[PrimaryKey]) -> set[Identifier]:
+        primary_key_tuple = tuple(primary_key.items())
+        try:
+            return self.__mapping[primary_key_tuple]
+        except KeyError:
+            identifier = Identifier(uuid4())
+            self.__mapping[primary_key_tuple] = identifier
+            self.__inverse_mapping[identifier] = primary_key_tuple
+            return identifier
+
+    def to_identifiers(self, primary_keys: Iterable[PrimaryKey]) -> frozenset[Identifier]:
         """Translate multiple primary keys to their corresponding identifiers."""
-        return {self.to_identifier(key) for key in primary_keys}
+        return frozenset(self.to_identifier(key) for key in primary_keys)
 
     def to_primary_key(self, identifier: Identifier) -> PrimaryKey:
         """Translate the given identifier to its corresponding primary key."""
-        primary_key_tuple = {v: k for k, v in self.__mapping.items()}[identifier]
-        return dict(primary_key_tuple)
+        return dict(self.__inverse_mapping[identifier])
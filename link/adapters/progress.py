@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Collection
 
 from link.domain.custom_types import Identifier
 from link.domain.state import Processes
@@ -47,9 +47,9 @@ class DJProgressDisplayAdapter(ProgessDisplay):
         self._translator = translator
         self._display = display
 
-    def start(self, process: Processes, to_be_processed: Iterable[Identifier]) -> None:
+    def start(self, process: Processes, to_be_processed: Collection[Identifier]) -> None:
         """Start showing progress information to the user."""
-        self._display.open(process.name, len(list(to_be_processed)), "row")
+        self._display.open(process.name, len(to_be_processed), "row")
 
     def update_current(self, new: Identifier) -> None:
         """Update the display to reflect a new entity being currently processed."""
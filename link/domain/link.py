@@ -27,25 +27,24 @@ def create_link(
         return {z: x for x, y in mapping.items() for z in y}
 
     def validate_arguments(
-        assignments: Mapping[Components, Iterable[Identifier]],
-        tainted: Iterable[Identifier],
+        assignments: Mapping[Components, frozenset[Identifier]],
+        tainted: frozenset[Identifier],
         processes: Mapping[Processes, Iterable[Identifier]],
     ) -> None:
-        assert set(assignments[Components.OUTBOUND]) <= set(
-            assignments[Components.SOURCE]
+        assert (
+            assignments[Components.OUTBOUND] <= assignments[Components.SOURCE]
         ), "Outbound must not be superset of source."
-        assert set(assignments[Components.LOCAL]) <= set(
-            assignments[Components.OUTBOUND]
+        assert (
+            assignments[Components.LOCAL] <= assignments[Components.OUTBOUND]
         ), "Local must not be superset of source."
-        assert set(tainted) <= set(assignments[Components.SOURCE])
+        assert tainted <= assignments[Components.SOURCE]
         assert pairwise_disjoint(processes.values()), "Identifiers can not undergo more than one process."
 
     def is_tainted(identifier: Identifier) -> bool:
-        assert tainted_identifiers is not None
-        return identifier in tainted_identifiers
+        return identifier in tainted
 
     def create_entities(
-        assignments: Mapping[Components, Iterable[Identifier]],
+        assignments: Mapping[Components, frozenset[Identifier]],
     ) -> set[Entity]:
         def create_entity(identifier: Identifier) -> Entity:
             presence = frozenset(
@@ -67,7 +66,7 @@ def create_link(
 
     def assign_entities(entities: Iterable[Entity]) -> dict[Components, set[Entity]]:
         def assign_to_component(component: Components) -> set[Entity]:
-            return {entity for entity in entities if entity.identifier in assignments[component]}
+            return {entity for entity in entities if entity.identifier in frozen_assignments[component]}
 
         return {component: assign_to_component(component) for component in Components}
 
@@ -75,9 +74,11 @@ def create_link(
         tainted_identifiers = set()
     if processes is None:
         processes = {}
-    validate_arguments(assignments, tainted_identifiers, processes)
+    frozen_assignments = {component: frozenset(identifiers) for component, identifiers in assignments.items()}
+    tainted = frozenset(tainted_identifiers)
+    validate_arguments(frozen_assignments, tainted, processes)
     processes_map = invert_mapping(processes)
-    entity_assignments = assign_entities(create_entities(assignments))
+    entity_assignments = assign_entities(create_entities(frozen_assignments))
     return Link(entity_assignments[Components.SOURCE])
 
 
@@ -87,17 +88,18 @@ class Link(Set[Entity]):
     def __init__(self, entities: Iterable[Entity]) -> None:
         """Initialize the link."""
         self._entities = set(entities)
+        self._entities_by_identifier = {entity.identifier: entity for entity in self._entities}
 
     @property
     def identifiers(self) -> frozenset[Identifier]:
         """Return the identifiers of all entities in the link."""
-        return frozenset(entity.identifier for entity in self)
+        return frozenset(self._entities_by_identifier)
 
     def __getitem__(self, identifier: Identifier) -> Entity:
         """Return the entity with the given identifier."""
         try:
-            return next(entity for entity in self if entity.identifier == identifier)
-        except StopIteration as error:
+            return self._entities_by_identifier[identifier]
+        except KeyError as error:
             raise KeyError("Requested entity not present in link") from error
 
     def list_unshared_entities(self) -> frozenset[Identifier]:
@@ -13,6 +13,16 @@ from .config import (
 )
 from .factory import Tiers, create_dj_connection_factory, create_dj_schema_factory, create_dj_table_factory
 
+_OUTBOUND_TABLE_DEFINITION = "\n".join(
+    [
+        "-> source_table",
+        "---",
+        "process: enum('PULL', 'DELETE', 'NONE')",
+        "is_flagged: enum('TRUE', 'FALSE')",
+        "is_deprecated: enum('TRUE', 'FALSE')",
+    ]
+)
+
 
 @dataclass(frozen=True)
 class DJConfiguration:
@@ -48,15 +58,7 @@ def create_tables(config: DJConfiguration) -> DJTables:
         lambda: config.outbound_table_name,
         create_dj_schema_factory(lambda: config.outbound_schema, source_connection),
         tier=Tiers.MANUAL,
-        definition=lambda: "\n".join(
-            [
-                "-> source_table",
-                "---",
-                "process: enum('PULL', 'DELETE', 'NONE')",
-                "is_flagged: enum('TRUE', 'FALSE')",
-                "is_deprecated: enum('TRUE', 'FALSE')",
-            ]
-        ),
+        definition=lambda: _OUTBOUND_TABLE_DEFINITION,
         context={"source_table": source_table},
     )
     local_table = create_dj_table_factory(
@@ -6,6 +6,8 @@ import warnings
 from collections.abc import Mapping
 from re import Match
 
+_STORE_PATTERN = re.compile(r"(?P<prefix>attach@)(?P<original>\S+)")
+
 
 def replace_stores(definition: str, stores: Mapping[str, str]) -> str:
     """Replace the store in the definition according to a mapping of replacement to original stores."""
@@ -20,5 +22,4 @@ def replace_stores(definition: str, stores: Mapping[str, str]) -> str:
             )
             return match.group(0)
 
-    pattern = re.compile(r"(?P<prefix>attach@)(?P<original>\S+)")
-    return re.sub(pattern, replace_store, definition)
+    return _STORE_PATTERN.sub(replace_store, definition)
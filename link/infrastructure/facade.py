@@ -106,17 +106,19 @@ class DJLinkFacade(AbstractDJLinkFacade):
             parts = (child for child in parent.children(as_objects=True) if is_part_table(parent, child))
             return {remove_parent_prefix_from_part_name(parent, part): part for part in parts}
 
-        def add_parts_to_local(download_path: str) -> None:
-            local_parts = get_parts(self.local())
-            for source_name, source_part in get_parts(self.source()).items():
+        def add_parts_to_local(source: Table, local: Table, download_path: str) -> None:
+            local_parts = get_parts(local)
+            for source_name, source_part in get_parts(source).items():
                 local_parts[source_name].insert(
                     (source_part & primary_keys).fetch(as_dict=True, download_path=download_path)
                 )
 
         primary_keys = list(primary_keys)
-        with self.local().connection.transaction, TemporaryDirectory() as download_path:
-            self.local().insert((self.source() & primary_keys).fetch(as_dict=True, download_path=download_path))
-            add_parts_to_local(download_path)
+        source = self.source()
+        local = self.local()
+        with local.connection.transaction, TemporaryDirectory() as download_path:
+            local.insert((source & primary_keys).fetch(as_dict=True, download_path=download_path))
+            add_parts_to_local(source, local, download_path)
 
     def remove_from_local(self, primary_keys: Iterable[PrimaryKey]) -> None:
         """Remove the entities corresponding to the given primary keys from the local table."""
@@ -128,9 +130,8 @@ class DJLinkFacade(AbstractDJLinkFacade):
 
     def start_pull_process(self, primary_keys: Iterable[PrimaryKey]) -> None:
         """Start the pull process of the entities corresponding to the given primary keys."""
-        self.outbound().insert(
-            (dict(key, process="PULL", is_flagged="FALSE", is_deprecated="FALSE") for key in primary_keys)
-        )
+        secondary = {"process": "PULL", "is_flagged": "FALSE", "is_deprecated": "FALSE"}
+        self.outbound().insert({**key, **secondary} for key in primary_keys)
 
     def finish_pull_process(self, primary_keys: Iterable[PrimaryKey]) -> None:
         """Finish the pull process of the entities corresponding to the given primary keys."""
@@ -147,9 +148,9 @@ class DJLinkFacade(AbstractDJLinkFacade):
     @staticmethod
     def __update_rows(table: Table, primary_keys: Iterable[PrimaryKey], changes: Mapping[str, Any]) -> None:
         with table.connection.transaction:
-            primary_keys = list(primary_keys)
-            rows = (table & primary_keys).fetch(as_dict=True)
+            restricted = table & list(primary_keys)
+            rows = restricted.fetch(as_dict=True)
             for row in rows:
                 row.update(changes)
-            (table & primary_keys).delete_quick()
+            restricted.delete_quick()
             table.insert(rows)
@@ -11,16 +11,22 @@ from .config import DatabaseServerCredentials
 from .dj_helpers import replace_stores
 
 
+@functools.lru_cache(maxsize=None)
+def _create_cached_connection(host: str, username: str, password: str) -> dj.Connection:
+    return dj.Connection(host, username, password)
+
+
 def create_dj_connection_factory(
     credential_provider: Callable[[], DatabaseServerCredentials]
 ) -> Callable[[], dj.Connection]:
-    """Create a factory producing DataJoint connections."""
-    create_cached_connection = functools.lru_cache(dj.Connection)
+    """Create a factory producing DataJoint connections.
+
+    Connections are shared between all factories, i.e. links using the same credentials reuse one connection.
+    """
 
     def create_dj_connection() -> dj.Connection:
-        return create_cached_connection(
-            credential_provider().host, credential_provider().username, credential_provider().password
-        )
+        credentials = credential_provider()
+        return _create_cached_connection(credentials.host, credentials.username, credentials.password)
 
     return create_dj_connection
 
@@ -82,8 +88,9 @@ def create_dj_table_factory(  # noqa: PLR0913
 
     @functools.lru_cache(maxsize=None)
     def create_dj_table() -> dj.Table:
+        schema = schema_factory()
         spawned_table_classes: dict[str, type[dj.Table]] = {}
-        schema_factory().spawn_missing_classes(context=spawned_table_classes)
+        schema.spawn_missing_classes(context=spawned_table_classes)
         try:
             return spawned_table_classes[name()]()
         except KeyError as exception:
@@ -91,10 +98,11 @@ def create_dj_table_factory(  # noqa: PLR0913
                 raise RuntimeError from exception
             part_definitions: dict[str, str] = {}
             if parts is not None:
-                for child in parts().children(as_objects=True):
-                    if not child.table_name.startswith(parts().table_name + "__"):
+                parent = parts()
+                for child in parent.children(as_objects=True):
+                    if not child.table_name.startswith(parent.table_name + "__"):
                         continue
-                    part_definition = child.describe(printout=False).replace(parts().full_table_name, "master")
+                    part_definition = child.describe(printout=False).replace(parent.full_table_name, "master")
                     part_definitions[dj.utils.to_camel_case(child.table_name.split("__")[-1])] = part_definition
             for part_name, part_definition in part_definitions.items():
                 part_definitions[part_name] = replace_stores(part_definition, replacement_stores)
@@ -106,6 +114,6 @@ def create_dj_table_factory(  # noqa: PLR0913
             processed_definition = replace_stores(definition(), replacement_stores)
             table_cls = type(name(), (tier.value,), {"definition": processed_definition, **part_tables})
             processed_context = {name: factory() for name, factory in context.items()}
-            return schema_factory()(table_cls, context=processed_context)()
+            return schema(table_cls, context=processed_context)()
 
     return create_dj_table
@@ -1,6 +1,7 @@
 """Contains mixins that add functionality to DataJoint tables."""
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from typing import Iterable, Sequence, cast
 
@@ -22,9 +23,11 @@ class SourceEndpoint(Table):
 
     def pull(self, *, display_progress: bool = False) -> None:
         """Pull unshared entities from the source table into the local table."""
+        primary_keys = self.proj().fetch(as_dict=True)
+        if not primary_keys:
+            return
         if display_progress:
             self._progress_view.enable()
-        primary_keys = self.proj().fetch(as_dict=True)
         self._controller.pull(primary_keys)
         self._progress_view.disable()
 
@@ -43,10 +46,11 @@ def create_source_endpoint_factory(
 ) -> Callable[[], SourceEndpoint]:
     """Create a callable that returns the source endpoint when called."""
 
-    def create_source_endpoint() -> SourceEndpoint:
+    @functools.lru_cache(maxsize=None)
+    def create_source_endpoint_cls() -> type[SourceEndpoint]:
         source_table_cls = type(source_table())
         return cast(
-            SourceEndpoint,
+            "type[SourceEndpoint]",
             type(
                 source_table_cls.__name__,
                 (SourceEndpoint, source_table_cls),
@@ -55,10 +59,12 @@ def create_source_endpoint_factory(
                     "_outbound_table": staticmethod(outbound_table),
                     "_progress_view": progress_view,
                 },
-            )()
-            & restriction,
+            ),
         )
 
+    def create_source_endpoint() -> SourceEndpoint:
+        return create_source_endpoint_cls()() & restriction
+
     return create_source_endpoint
 
 
@@ -71,9 +77,11 @@ class LocalEndpoint(Table):
 
     def delete(self, *, display_progress: bool = False) -> None:
         """Delete shared entities from the local table."""
+        primary_keys = self.proj().fetch(as_dict=True)
+        if not primary_keys:
+            return
         if display_progress:
             self._progress_view.enable()
-        primary_keys = self.proj().fetch(as_dict=True)
         self._controller.delete(primary_keys)
         self._progress_view.disable()
 
@@ -87,13 +95,14 @@ def create_local_endpoint(
     controller: DJController, tables: DJTables, source_restriction: Iterable[PrimaryKey], progress_view: ProgressView
 ) -> type[LocalEndpoint]:
     """Create the local endpoint."""
+    local_table_cls = type(tables.local())
     return cast(
         "type[LocalEndpoint]",
         type(
-            type(tables.local()).__name__,
+            local_table_cls.__name__,
             (
                 LocalEndpoint,
-                type(tables.local()),
+                local_table_cls,
             ),
             {
                 "_controller": controller,
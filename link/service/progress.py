@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Collection
 
 from link.domain.custom_types import Identifier
 from link.domain.state import Processes
@@ -12,7 +12,7 @@ class ProgessDisplay(ABC):
     """Shows information about the progress of a batch of entities being processed to the user."""
 
     @abstractmethod
-    def start(self, process: Processes, to_be_processed: Iterable[Identifier]) -> None:
+    def start(self, process: Processes, to_be_processed: Collection[Identifier]) -> None:
         """Start showing progress information to the user."""
 
     @abstractmethod
@@ -30,7 +30,7 @@ class UnitOfWork(ABC):
         self._link: Link | None = None
         self._updates: deque[events.StateChanged] = deque()
         self._events: deque[events.Event] = deque()
-        self._seen: list[Entity] = []
+        self._seen: dict[Identifier, Entity] = {}
 
     def __enter__(self) -> UnitOfWork:
         """Enter the context in which updates to entities can be made."""
@@ -48,8 +48,7 @@ class UnitOfWork(ABC):
                 assert hasattr(entity, "_is_expired")
                 if entity._is_expired:
                     raise RuntimeError("Can not apply operation to expired entity.")
-                if entity not in self._seen:
-                    self._seen.append(entity)
+                self._seen.setdefault(entity.identifier, entity)
                 current_state = entity.state
                 original(operation)
                 new_state = entity.state
@@ -84,9 +83,8 @@ class UnitOfWork(ABC):
         """Persist updates made to the link."""
         if self._link is None:
             raise RuntimeError("Not available outside of context")
-        while self._updates:
-            self._gateway.apply([self._updates.popleft()])
-        for entity in self._seen:
+        self._gateway.apply(list(self._updates))
+        for entity in self._seen.values():
             while entity.events:
                 self._events.append(entity.events.popleft())
         self.rollback()
@@ -1,26 +1,27 @@
 """Contains function for creating assignments."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, Mapping, Optional
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 from link.domain.custom_types import Identifier
 from link.domain.state import Components
 
-__UUIDS: dict[str, UUID] = {}
-
 
+@lru_cache(maxsize=None)
 def create_identifier(name: str) -> Identifier:
-    return Identifier(__UUIDS.setdefault(name, uuid4()))
+    return Identifier(uuid4())
 
 
-def create_identifiers(*names: str) -> set[Identifier]:
-    return {create_identifier(name) for name in names}
+@lru_cache(maxsize=None)
+def create_identifiers(*names: str) -> frozenset[Identifier]:
+    return frozenset(create_identifier(name) for name in names)
 
 
 def create_assignments(
     assignments: Optional[Mapping[Components, Iterable[str]]] = None
-) -> dict[Components, set[Identifier]]:
+) -> dict[Components, frozenset[Identifier]]:
     """Create assignments of identifiers to components."""
     if assignments is None:
         assignments = {}
@@ -1,23 +1,20 @@
 from __future__ import annotations
 
 import os
-import pathlib
 from concurrent import futures
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
+from functools import cached_property
 from random import choices
 from string import ascii_lowercase
 
 import datajoint as dj
 import docker
-import minio
 import pymysql
 import pytest
-from minio.deleteobjects import DeleteObject
 
 from tests.docker.runner import ContainerRunner
 
-SCOPE = os.environ.get("SCOPE", "session")
 REMOVE = True
 DATABASE_IMAGE = "cblessing24/mariadb:11.1"
 MINIO_IMAGE = "minio/minio:RELEASE.2023-11-01T18-37-25Z"
@@ -25,9 +22,9 @@ DATABASE_ROOT_PASSWORD = "root"
 
 
 def pytest_collection_modifyitems(config, items):
+    functional_prefix = os.path.join(config.rootdir, "tests", "functional", "")
     for item in items:
-        module_path = pathlib.Path(item.fspath)
-        if config.rootdir / pathlib.Path("tests/functional") in module_path.parents:
+        if str(item.fspath).startswith(functional_prefix):
             item.add_marker(pytest.mark.slow)
 
 
@@ -54,6 +51,18 @@ class HealthCheckConfig:
     interval_seconds: int = 1  # interval between health checks
     timeout_seconds: int = 5  # max time a health check test has to finish
 
+    @cached_property
+    def start_period_nanoseconds(self):
+        return int(self.start_period_seconds * 1e9)
+
+    @cached_property
+    def interval_nanoseconds(self):
+        return int(self.interval_seconds * 1e9)
+
+    @cached_property
+    def timeout_nanoseconds(self):
+        return int(self.timeout_seconds * 1e9)
+
 
 @dataclass(frozen=True)
 class DatabaseConfig:
@@ -98,12 +107,12 @@ class StoreConfig:
     secret_key: str
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def docker_client():
     return docker.client.from_env()
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def create_random_string():
     def _create_random_string(length=6):
         return "".join(choices(ascii_lowercase, k=length))
@@ -111,12 +120,12 @@ def create_random_string():
     return _create_random_string
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def network():
     return os.environ["DOCKER_NETWORK"]
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def get_db_spec(create_random_string, network):
     def _get_db_spec(name):
         schema_name = "end_user_schema"
@@ -137,7 +146,7 @@ def get_db_spec(create_random_string, network):
     return _get_db_spec
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def get_minio_spec(create_random_string, network):
     def _get_minio_spec(name):
         return MinIOSpec(
@@ -157,34 +166,44 @@ def get_minio_spec(create_random_string, network):
     return _get_minio_spec
 
 
+def _get_database_container_kwargs(spec):
+    return dict(environment=dict(MYSQL_ROOT_PASSWORD=spec.config.password))
+
+
+def _get_minio_container_kwargs(spec):
+    health_check = spec.container.health_check
+    return dict(
+        environment=dict(MINIO_ROOT_USER=spec.config.access_key, MINIO_ROOT_PASSWORD=spec.config.secret_key),
+        command=["server", "/data"],
+        healthcheck=dict(
+            test=["CMD", "mc", "ready", "local"],
+            start_period=health_check.start_period_nanoseconds,
+            interval=health_check.interval_nanoseconds,
+            retries=health_check.max_retries,
+            timeout=health_check.timeout_nanoseconds,
+        ),
+    )
+
+
+_CONTAINER_KWARGS_GETTERS = {
+    DatabaseSpec: _get_database_container_kwargs,
+    MinIOSpec: _get_minio_container_kwargs,
+}
+
+
 def get_runner_kwargs(docker_client, spec):
-    common = dict(
+    try:
+        get_container_kwargs = _CONTAINER_KWARGS_GETTERS[type(spec)]
+    except KeyError:
+        raise ValueError from None
+    processed_container_config = dict(
         detach=True,
         network=spec.container.network,
         name=spec.container.name,
         image=spec.container.image,
         ulimits=[docker.types.Ulimit(**asdict(ulimit)) for ulimit in spec.container.ulimits],
+        **get_container_kwargs(spec),
     )
-    if isinstance(spec, DatabaseSpec):
-        processed_container_config = dict(
-            environment=dict(MYSQL_ROOT_PASSWORD=spec.config.password),
-            **common,
-        )
-    elif isinstance(spec, MinIOSpec):
-        processed_container_config = dict(
-            environment=dict(MINIO_ROOT_USER=spec.config.access_key, MINIO_ROOT_PASSWORD=spec.config.secret_key),
-            command=["server", "/data"],
-            healthcheck=dict(
-                test=["CMD", "mc", "ready", "local"],
-                start_period=int(spec.container.health_check.start_period_seconds * 1e9),  # nanoseconds
-                interval=int(spec.container.health_check.interval_seconds * 1e9),  # nanoseconds
-                retries=spec.container.health_check.max_retries,
-                timeout=int(spec.container.health_check.timeout_seconds * 1e9),  # nanoseconds
-            ),
-            **common,
-        )
-    else:
-        raise ValueError
     return {
         "docker_client": docker_client,
         "container_config": processed_container_config,
@@ -196,7 +215,7 @@ def get_runner_kwargs(docker_client, spec):
     }
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def create_user(create_random_string):
     def _create_user(db_spec, grants):
         user_name = create_random_string()
@@ -208,9 +227,16 @@ def create_user(create_random_string):
         )
         with mysql_conn(db_spec) as connection:
             with connection.cursor() as cursor:
-                cursor.execute(f"CREATE USER '{config.name}'@'%' IDENTIFIED BY '{config.password}';")
-                for grant in config.grants:
-                    cursor.execute(grant)
+                cursor.execute(
+                    ";\n".join(
+                        [
+                            f"CREATE USER '{config.name}'@'%' IDENTIFIED BY '{config.password}'",
+                            *(grant.rstrip(";") for grant in config.grants),
+                        ]
+                    )
+                )
+                while cursor.nextset():
+                    pass
             connection.commit()
         return config
 
@@ -242,14 +268,14 @@ def create_containers(docker_client, specs):
         execute_runner_method("stop")
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def databases(get_db_spec, docker_client):
     kinds_to_specs = {kind: get_db_spec(kind) for kind in ["source", "local"]}
     with create_containers(docker_client, kinds_to_specs.values()):
         yield kinds_to_specs
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def minios(get_minio_spec, docker_client):
     kinds_to_specs = {kind: get_minio_spec(kind) for kind in ["source", "local"]}
     with create_containers(docker_client, kinds_to_specs.values()):
@@ -265,6 +291,7 @@ def mysql_conn(db_spec):
             user="root",
             password=db_spec.config.password,
             cursorclass=pymysql.cursors.DictCursor,
+            client_flag=pymysql.constants.CLIENT.MULTI_STATEMENTS,
         )
         yield connection
     finally:
@@ -272,9 +299,11 @@ def mysql_conn(db_spec):
             connection.close()
 
 
-@pytest.fixture(scope=SCOPE)
+@pytest.fixture(scope="session")
 def get_minio_client():
     def _get_minio_client(spec):
+        import minio
+
         return minio.Minio(
             spec.container.name + ":9000",
             access_key=spec.config.access_key,
@@ -287,12 +316,12 @@ def get_minio_client():
 
 @pytest.fixture()
 def get_store_spec(create_random_string):
-    def _get_store_spec(minio_spec, protocol="s3", port=9000):
+    def _get_store_spec(minio_spec, bucket, protocol="s3", port=9000):
         return StoreConfig(
             name=create_random_string(),
             protocol=protocol,
             endpoint=f"{minio_spec.container.name}:{port}",
-            bucket=create_random_string(),
+            bucket=bucket,
             location=create_random_string(),
             access_key=minio_spec.config.access_key,
             secret_key=minio_spec.config.secret_key,
@@ -301,21 +330,6 @@ def get_store_spec(create_random_string):
     return _get_store_spec
 
 
-@pytest.fixture()
-def dj_connection():
-    @contextmanager
-    def _dj_connection():
-        connection = dj.Connection(
-            dj.config["database.host"], dj.config["database.user"], dj.config["database.password"]
-        )
-        try:
-            yield connection
-        finally:
-            connection.close()
-
-    return _dj_connection
-
-
 @pytest.fixture()
 def connection_config():
     @contextmanager
@@ -342,44 +356,68 @@ def connection_config():
 def temp_dj_store_config():
     @contextmanager
     def _temp_dj_store_config(stores):
-        with dj.config(stores={store.pop("name"): store for store in [asdict(store) for store in stores]}):
+        with dj.config(
+            stores={
+                store.name: {
+                    "protocol": store.protocol,
+                    "endpoint": store.endpoint,
+                    "bucket": store.bucket,
+                    "location": store.location,
+                    "access_key": store.access_key,
+                    "secret_key": store.secret_key,
+                }
+                for store in stores
+            }
+        ):
             yield
 
     return _temp_dj_store_config
 
 
+def delete_objects(client, bucket, prefix=None):
+    from minio.deleteobjects import DeleteObject
+
+    to_be_deleted = [
+        DeleteObject(object.object_name) for object in client.list_objects(bucket, prefix=prefix, recursive=True)
+    ]
+    if deletion_errors := list(client.remove_objects(bucket, to_be_deleted)):
+        raise RuntimeError(f"Error(s) during object deletion: {deletion_errors}")
+
+
+@pytest.fixture(scope="session")
+def buckets(minios, get_minio_client, create_random_string):
+    def create_bucket(spec, bucket):
+        get_minio_client(spec).make_bucket(bucket)
+        created_buckets[spec] = bucket
+
+    def remove_bucket(spec, bucket):
+        client = get_minio_client(spec)
+        delete_objects(client, bucket)
+        client.remove_bucket(bucket)
+
+    def execute_for_buckets(function, specs_to_buckets):
+        with futures.ThreadPoolExecutor() as executor:
+            for future in [executor.submit(function, *item) for item in specs_to_buckets.items()]:
+                future.result()
+
+    specs_to_buckets = {spec: create_random_string() for spec in minios.values()}
+    created_buckets = {}
+    try:
+        execute_for_buckets(create_bucket, specs_to_buckets)
+        yield specs_to_buckets
+    finally:
+        execute_for_buckets(remove_bucket, dict(created_buckets))
+
+
 @pytest.fixture()
-def temp_store(get_minio_client, get_store_spec):
+def temp_store(get_minio_client, get_store_spec, buckets):
     @contextmanager
     def _temp_store(minio_spec):
-        def create_bucket():
-            store_spec = get_store_spec(minio_spec)
-            get_minio_client(minio_spec).make_bucket(store_spec.bucket)
-            return store_spec
-
-        def delete_objects():
-            to_be_deleted = [
-                DeleteObject(object.object_name)
-                for object in get_minio_client(minio_spec).list_objects(store_spec.bucket, recursive=True)
-            ]
-            if deletion_errors := list(get_minio_client(minio_spec).remove_objects(store_spec.bucket, to_be_deleted)):
-                raise RuntimeError(f"Error(s) during object deletion: {deletion_errors}")
-
-        def cleanup_bucket():
-            try:
-                get_minio_client(minio_spec).remove_bucket(store_spec.bucket)
-            except minio.error.S3Error as error:
-                if error.code == "BucketNotEmpty":
-                    delete_objects()
-                    get_minio_client(minio_spec).remove_bucket(store_spec.bucket)
-                else:
-                    raise error
-
-        store_spec = create_bucket()
+        store_spec = get_store_spec(minio_spec, buckets[minio_spec])
         try:
             yield store_spec
         finally:
-            cleanup_bucket()
+            delete_objects(get_minio_client(minio_spec), store_spec.bucket, prefix=f"{store_spec.location}/")
 
     return _temp_store
 
@@ -503,16 +541,15 @@ def create_table():
 
 
 @pytest.fixture()
-def prepare_table(dj_connection):
+def prepare_table():
     def _prepare_table(schema, table_cls, *, data=None, parts=None, context=None):
         if data is None:
             data = []
         if parts is None:
             parts = {}
-        with dj_connection() as connection:
-            dj.schema(schema, connection=connection, context=context)(table_cls)
-            table_cls().insert(data, allow_direct_insert=True)
-            for name, part_data in parts.items():
-                getattr(table_cls, name).insert(part_data)
+        dj.schema(schema, connection=dj.conn(), context=context)(table_cls)
+        table_cls().insert(data, allow_direct_insert=True)
+        for name, part_data in parts.items():
+            getattr(table_cls, name).insert(part_data)
 
     return _prepare_table
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Iterable
+from itertools import groupby
+from typing import Callable, Iterable
 
 from link.domain import events
 from link.domain.custom_types import Identifier
@@ -29,25 +30,52 @@ class FakeLinkGateway(LinkGateway):
         return create_link(self.assignments, tainted_identifiers=self.tainted_identifiers, processes=self.processes)
 
     def apply(self, updates: Iterable[events.StateChanged]) -> None:
-        for update in updates:
-            if update.command is Commands.START_PULL_PROCESS:
-                self.processes[Processes.PULL].add(update.identifier)
-                self.assignments[Components.OUTBOUND].add(update.identifier)
-            elif update.command is Commands.ADD_TO_LOCAL:
-                self.assignments[Components.LOCAL].add(update.identifier)
-            elif update.command is Commands.FINISH_PULL_PROCESS:
-                self.processes[Processes.PULL].remove(update.identifier)
-            elif update.command is Commands.START_DELETE_PROCESS:
-                self.processes[Processes.DELETE].add(update.identifier)
-            elif update.command is Commands.REMOVE_FROM_LOCAL:
-                self.assignments[Components.LOCAL].remove(update.identifier)
-            elif update.command is Commands.FINISH_DELETE_PROCESS:
-                self.processes[Processes.DELETE].remove(update.identifier)
-                self.assignments[Components.OUTBOUND].remove(update.identifier)
-            elif update.command is Commands.DEPRECATE:
-                try:
-                    self.processes[Processes.DELETE].remove(update.identifier)
-                except KeyError:
-                    self.processes[Processes.PULL].remove(update.identifier)
-            else:
-                raise ValueError("Unsupported command encountered")
+        for command, command_updates in groupby(updates, key=lambda update: update.command):
+            try:
+                handler = _COMMAND_HANDLERS[command]
+            except KeyError as error:
+                raise ValueError("Unsupported command encountered") from error
+            handler(self, {update.identifier for update in command_updates})
+
+
+def _start_pull_process(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    gateway.processes[Processes.PULL].update(identifiers)
+    gateway.assignments[Components.OUTBOUND].update(identifiers)
+
+
+def _add_to_local(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    gateway.assignments[Components.LOCAL].update(identifiers)
+
+
+def _finish_pull_process(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    gateway.processes[Processes.PULL].difference_update(identifiers)
+
+
+def _start_delete_process(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    gateway.processes[Processes.DELETE].update(identifiers)
+
+
+def _remove_from_local(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    gateway.assignments[Components.LOCAL].difference_update(identifiers)
+
+
+def _finish_delete_process(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    gateway.processes[Processes.DELETE].difference_update(identifiers)
+    gateway.assignments[Components.OUTBOUND].difference_update(identifiers)
+
+
+def _deprecate(gateway: FakeLinkGateway, identifiers: set[Identifier]) -> None:
+    deleting = identifiers & gateway.processes[Processes.DELETE]
+    gateway.processes[Processes.DELETE].difference_update(deleting)
+    gateway.processes[Processes.PULL].difference_update(identifiers - deleting)
+
+
+_COMMAND_HANDLERS: dict[Commands, Callable[[FakeLinkGateway, set[Identifier]], None]] = {
+    Commands.START_PULL_PROCESS: _start_pull_process,
+    Commands.ADD_TO_LOCAL: _add_to_local,
+    Commands.FINISH_PULL_PROCESS: _finish_pull_process,
+    Commands.START_DELETE_PROCESS: _start_delete_process,
+    Commands.REMOVE_FROM_LOCAL: _remove_from_local,
+    Commands.FINISH_DELETE_PROCESS: _finish_delete_process,
+    Commands.DEPRECATE: _deprecate,
+}
@@ -265,23 +265,17 @@ def has_state(tables: Tables, expected: State) -> bool:
     def get_children_state(table: Table) -> dict[str, list[dict[str, Any]]]:
         return {child.table_name: child.fetch(as_dict=True) for child in table.children(as_objects=True)}
 
-    def get_state() -> State:
-        return State(
-            source=TableState(
-                main=tables["source"].fetch(as_dict=True),
-                children=get_children_state(tables["source"]),
-            ),
-            outbound=TableState(
-                main=tables["outbound"].fetch(as_dict=True),
-                children=get_children_state(tables["outbound"]),
-            ),
-            local=TableState(
-                main=tables["local"].fetch(as_dict=True),
-                children=get_children_state(tables["local"]),
-            ),
-        )
-
-    return get_state() == expected
+    def get_table_state(table: Table) -> TableState:
+        return TableState(main=table.fetch(as_dict=True), children=get_children_state(table))
+
+    return all(
+        get_table_state(table) == expected_table_state
+        for table, expected_table_state in [
+            (tables["local"], expected.local),
+            (tables["outbound"], expected.outbound),
+            (tables["source"], expected.source),
+        ]
+    )
 
 
 class as_stdin:
@@ -646,3 +640,28 @@ def test_applying_multiple_commands() -> None:
             local=TableState([{"a": 0, "b": 1}]),
         ),
     )
+
+
+def test_applying_all_updates_of_pull_at_once_keeps_their_order() -> None:
+    tables, gateway = initialize(
+        "link",
+        primary={"a"},
+        non_primary={"b"},
+        initial=State(
+            source=TableState([{"a": 0, "b": 1}]),
+            outbound=TableState([{"a": 0, "process": "DELETE", "is_flagged": "FALSE", "is_deprecated": "FALSE"}]),
+        ),
+    )
+    entity = gateway.create_link()[gateway.translator.to_identifier({"a": 0})]
+
+    entity.pull()
+    gateway.apply([event for event in entity.events if isinstance(event, events.StateChanged)])
+
+    assert has_state(
+        tables,
+        State(
+            source=TableState([{"a": 0, "b": 1}]),
+            outbound=TableState([{"a": 0, "process": "NONE", "is_flagged": "FALSE", "is_deprecated": "FALSE"}]),
+            local=TableState([{"a": 0, "b": 1}]),
+        ),
+    )
@@ -10,12 +10,16 @@ from link.domain.state import Components, Processes, State, states
 from link.service.handlers import delete, delete_entity, list_unshared_entities, pull, pull_entity
 from link.service.messagebus import CommandHandlers, EventHandlers, MessageBus
 from link.service.uow import UnitOfWork
-from tests.assignments import create_assignments, create_identifiers
+from tests.assignments import create_assignments, create_identifier, create_identifiers
 
 from .gateway import FakeLinkGateway
 
 T = TypeVar("T", bound=events.Event)
 
+IDENTIFIER = create_identifier("1")
+
+IDENTIFIERS = create_identifiers("1")
+
 
 class FakeOutputPort(Generic[T]):
     def __init__(self) -> None:
@@ -41,11 +45,11 @@ def create_uow(state: type[State], process: Processes | None = None, is_tainted:
         assert not is_tainted
 
     if is_tainted:
-        tainted_identifiers = create_identifiers("1")
+        tainted_identifiers = IDENTIFIERS
     else:
-        tainted_identifiers = set()
+        tainted_identifiers = frozenset()
     if process is not None:
-        processes = {process: create_identifiers("1")}
+        processes = {process: IDENTIFIERS}
     else:
         processes = {}
     assignments = {Components.SOURCE: {"1"}}
@@ -143,9 +147,9 @@ STATES: list[EntityConfig] = [
 def test_deleted_entity_ends_in_correct_state(state: EntityConfig, expected: type[State]) -> None:
     uow = create_uow(**state)
     delete_service = create_delete_service(uow)
-    delete_service(commands.DeleteEntities(frozenset(create_identifiers("1"))))
+    delete_service(commands.DeleteEntities(IDENTIFIERS))
     with uow:
-        assert next(iter(uow.link)).state is expected
+        assert uow.link[IDENTIFIER].state is expected
 
 
 @pytest.mark.parametrize(
@@ -168,9 +172,9 @@ def test_deleted_entity_ends_in_correct_state(state: EntityConfig, expected: typ
 def test_pulled_entity_ends_in_correct_state(state: EntityConfig, expected: type[State]) -> None:
     uow = create_uow(**state)
     pull_service = create_pull_service(uow)
-    pull_service(commands.PullEntities(frozenset(create_identifiers("1"))))
+    pull_service(commands.PullEntities(IDENTIFIERS))
     with uow:
-        assert next(iter(uow.link)).state is expected
+        assert uow.link[IDENTIFIER].state is expected
 
 
 def test_correct_response_model_gets_passed_to_list_unshared_entities_output_port() -> None:
@@ -179,6 +183,6 @@ def test_correct_response_model_gets_passed_to_list_unshared_entities_output_por
             create_assignments({Components.SOURCE: {"1", "2"}, Components.OUTBOUND: {"2"}, Components.LOCAL: {"2"}})
         )
     )
-    output_port = FakeOutputPort[events.UnsharedEntitiesListed]()
+    output_port: FakeOutputPort[events.UnsharedEntitiesListed] = FakeOutputPort()
     list_unshared_entities(commands.ListUnsharedEntities(), uow=uow, output_port=output_port)
-    assert set(output_port.response.identifiers) == create_identifiers("1")
+    assert set(output_port.response.identifiers) == IDENTIFIERS
@@ -72,7 +72,7 @@ def test_unable_to_rollback_outside_of_context() -> None:
 def test_entity_expires_when_committing() -> None:
     _, uow = initialize({Components.SOURCE: {"1"}})
     with uow:
-        entity = next(entity for entity in uow.link if entity.identifier == create_identifier("1"))
+        entity = uow.link[create_identifier("1")]
         uow.commit()
         with pytest.raises(RuntimeError, match="expired entity"):
             entity.apply(Operations.START_PULL)
@@ -81,7 +81,7 @@ def test_entity_expires_when_committing() -> None:
 def test_entity_expires_when_rolling_back() -> None:
     _, uow = initialize({Components.SOURCE: {"1"}})
     with uow:
-        entity = next(entity for entity in uow.link if entity.identifier == create_identifier("1"))
+        entity = uow.link[create_identifier("1")]
         uow.rollback()
         with pytest.raises(RuntimeError, match="expired entity"):
             entity.apply(Operations.START_PULL)
@@ -90,7 +90,7 @@ def test_entity_expires_when_rolling_back() -> None:
 def test_entity_expires_when_leaving_context() -> None:
     _, uow = initialize({Components.SOURCE: {"1"}})
     with uow:
-        entity = next(entity for entity in uow.link if entity.identifier == create_identifier("1"))
+        entity = uow.link[create_identifier("1")]
     with pytest.raises(RuntimeError, match="expired entity"):
         entity.apply(Operations.START_PULL)
 
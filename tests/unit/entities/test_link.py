@@ -156,7 +156,7 @@ class TestCreateLink:
 class TestLink:
     @staticmethod
     @pytest.fixture()
-    def assignments() -> dict[Components, set[Identifier]]:
+    def assignments() -> dict[Components, frozenset[Identifier]]:
         return create_assignments({Components.SOURCE: {"1", "2"}, Components.OUTBOUND: {"1"}, Components.LOCAL: {"1"}})
 
     @staticmethod
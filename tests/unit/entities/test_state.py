@@ -6,7 +6,7 @@ import pytest
 
 from link.domain import events
 from link.domain.custom_types import Identifier
-from link.domain.link import create_link
+from link.domain.link import Link, create_link
 from link.domain.state import (
     Commands,
     Components,
@@ -18,6 +18,23 @@ from link.domain.state import (
 )
 from tests.assignments import create_assignments, create_identifier, create_identifiers
 
+IDENTIFIERS = create_identifiers("1")
+
+
+@pytest.fixture(scope="module")
+def link_in_all_states() -> Link:
+    return create_link(
+        create_assignments(
+            {
+                Components.SOURCE: {"1", "2", "3", "4", "5", "6"},
+                Components.OUTBOUND: {"2", "3", "4", "5", "6"},
+                Components.LOCAL: {"3", "4", "5"},
+            }
+        ),
+        tainted_identifiers=create_identifiers("5", "6"),
+        processes={Processes.PULL: create_identifiers("2", "3")},
+    )
+
 
 @pytest.mark.parametrize(
     ("identifier", "state", "operations"),
@@ -35,20 +52,9 @@ from tests.assignments import create_assignments, create_identifier, create_iden
     ],
 )
 def test_invalid_transitions_returns_unchanged_entity(
-    identifier: Identifier, state: type[State], operations: list[Operations]
+    link_in_all_states: Link, identifier: Identifier, state: type[State], operations: list[Operations]
 ) -> None:
-    link = create_link(
-        create_assignments(
-            {
-                Components.SOURCE: {"1", "2", "3", "4", "5", "6"},
-                Components.OUTBOUND: {"2", "3", "4", "5", "6"},
-                Components.LOCAL: {"3", "4", "5"},
-            }
-        ),
-        tainted_identifiers=create_identifiers("5", "6"),
-        processes={Processes.PULL: create_identifiers("2", "3")},
-    )
-    entity = next(entity for entity in link if entity.identifier == identifier)
+    entity = link_in_all_states[identifier]
     for operation in operations:
         result = events.InvalidOperationRequested(operation, identifier, state)
         entity.apply(operation)
@@ -75,9 +81,9 @@ def test_start_pulling_unshared_entity_returns_correct_entity() -> None:
     ("process", "tainted_identifiers", "new_state", "new_process", "command"),
     [
         (Processes.PULL, set(), states.Received, Processes.PULL, Commands.ADD_TO_LOCAL),
-        (Processes.PULL, create_identifiers("1"), states.Deprecated, Processes.NONE, Commands.DEPRECATE),
+        (Processes.PULL, IDENTIFIERS, states.Deprecated, Processes.NONE, Commands.DEPRECATE),
         (Processes.DELETE, set(), states.Unshared, Processes.NONE, Commands.FINISH_DELETE_PROCESS),
-        (Processes.DELETE, create_identifiers("1"), states.Deprecated, Processes.NONE, Commands.DEPRECATE),
+        (Processes.DELETE, IDENTIFIERS, states.Deprecated, Processes.NONE, Commands.DEPRECATE),
     ],
 )
 def test_processing_activated_entity_returns_correct_entity(
@@ -89,7 +95,7 @@ def test_processing_activated_entity_returns_correct_entity(
 ) -> None:
     link = create_link(
         create_assignments({Components.SOURCE: {"1"}, Components.OUTBOUND: {"1"}}),
-        processes={process: create_identifiers("1")},
+        processes={process: IDENTIFIERS},
         tainted_identifiers=tainted_identifiers,
     )
     entity = next(iter(link))
@@ -105,9 +111,9 @@ def test_processing_activated_entity_returns_correct_entity(
     ("process", "tainted_identifiers", "new_state", "new_process", "command"),
     [
         (Processes.PULL, set(), states.Shared, Processes.NONE, Commands.FINISH_PULL_PROCESS),
-        (Processes.PULL, create_identifiers("1"), states.Tainted, Processes.NONE, Commands.FINISH_PULL_PROCESS),
+        (Processes.PULL, IDENTIFIERS, states.Tainted, Processes.NONE, Commands.FINISH_PULL_PROCESS),
         (Processes.DELETE, set(), states.Activated, Processes.DELETE, Commands.REMOVE_FROM_LOCAL),
-        (Processes.DELETE, create_identifiers("1"), states.Activated, Processes.DELETE, Commands.REMOVE_FROM_LOCAL),
+        (Processes.DELETE, IDENTIFIERS, states.Activated, Processes.DELETE, Commands.REMOVE_FROM_LOCAL),
     ],
 )
 def test_processing_received_entity_returns_correct_entity(
@@ -119,7 +125,7 @@ def test_processing_received_entity_returns_correct_entity(
 ) -> None:
     link = create_link(
         create_assignments({Components.SOURCE: {"1"}, Components.OUTBOUND: {"1"}, Components.LOCAL: {"1"}}),
-        processes={process: {create_identifier("1")}},
+        processes={process: IDENTIFIERS},
         tainted_identifiers=tainted_identifiers,
     )
     entity = next(iter(link))
@@ -155,7 +161,7 @@ def test_starting_delete_on_shared_entity_returns_correct_entity() -> None:
 def test_starting_delete_on_tainted_entity_returns_correct_commands() -> None:
     link = create_link(
         create_assignments({Components.SOURCE: {"1"}, Components.OUTBOUND: {"1"}, Components.LOCAL: {"1"}}),
-        tainted_identifiers={create_identifier("1")},
+        tainted_identifiers=IDENTIFIERS,
     )
     entity = next(iter(link))
     transition = Transition(states.Tainted, states.Received)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import datajoint as dj
+import pytest
+
+from link.infrastructure import factory
+from link.infrastructure.config import DatabaseServerCredentials
+
+
+class FakeConnection:
+    def __init__(self, host: str, user: str, password: str) -> None:
+        self.host = host
+        self.user = user
+        self.password = password
+
+
+@pytest.fixture(autouse=True)
+def fake_connection(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(dj, "Connection", FakeConnection)
+    factory._create_cached_connection.cache_clear()
+    yield
+    factory._create_cached_connection.cache_clear()
+
+
+def test_factories_with_equal_credentials_share_connection() -> None:
+    first = factory.create_dj_connection_factory(lambda: DatabaseServerCredentials("host", "user", "password"))
+    second = factory.create_dj_connection_factory(lambda: DatabaseServerCredentials("host", "user", "password"))
+    assert first() is second()
+
+
+@pytest.mark.parametrize(
+    "credentials",
+    [
+        DatabaseServerCredentials("other_host", "user", "password"),
+        DatabaseServerCredentials("host", "other_user", "password"),
+        DatabaseServerCredentials("host", "user", "other_password"),
+    ],
+)
+def test_factories_with_different_credentials_use_different_connections(
+    credentials: DatabaseServerCredentials,
+) -> None:
+    first = factory.create_dj_connection_factory(lambda: DatabaseServerCredentials("host", "user", "password"))
+    second = factory.create_dj_connection_factory(lambda: credentials)
+    assert first() is not second()